@@ -0,0 +1,27 @@
+"""Request routing with orjson body parsing."""
+
+from typing import Any, Callable
+
+import fastapi
+import orjson
+from fastapi.routing import APIRoute
+
+
+class ORJSONRequest(fastapi.Request):
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """Route that parses JSON request bodies with orjson."""
+
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+
+        async def route_handler(request: fastapi.Request) -> fastapi.Response:
+            request = ORJSONRequest(request.scope, request.receive)
+            return await original_route_handler(request)
+
+        return route_handler
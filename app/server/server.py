@@ -1,15 +1,16 @@
-import json
 import logging
 from contextlib import asynccontextmanager
 
 import fastapi
+import orjson
 import pydantic
 from core import exceptions
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from json_advanced import dumps
 
 from . import config, db
+from .routing import ORJSONRoute
 
 
 @asynccontextmanager
@@ -37,14 +38,16 @@ app = fastapi.FastAPI(
         "url": "https://github.com/mahdikiani/FastAPILaunchpad/blob/main/LICENSE",
     },
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
+app.router.route_class = ORJSONRoute
 
 
 @app.exception_handler(exceptions.BaseHTTPException)
 async def base_http_exception_handler(
     request: fastapi.Request, exc: exceptions.BaseHTTPException
 ):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"message": exc.message, "error": exc.error},
     )
@@ -55,27 +58,21 @@ async def base_http_exception_handler(
 async def pydantic_exception_handler(
     request: fastapi.Request, exc: pydantic.ValidationError
 ):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "message": str(exc),
             "error": "Exception",
-            "erros": json.loads(dumps(exc.errors())),
+            "erros": orjson.loads(dumps(exc.errors())),
         },
     )
 
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request: fastapi.Request, exc: Exception):
-    import traceback
-
-    traceback_str = "".join(traceback.format_tb(exc.__traceback__))
-    # body = request._body
-
-    logging.error(f"Exception: {traceback_str} {exc}")
-    logging.error(f"Exception on request: {request.url}")
-    # logging.error(f"Exception on request: {await request.body()}")
-    return JSONResponse(
+    logging.error("Exception on request: %s", request.url, exc_info=exc)
+    # logging.error("Exception on request: %s", await request.body())
+    return ORJSONResponse(
         status_code=500,
         content={"message": str(exc), "error": "Exception"},
     )